@@ -1,9 +1,21 @@
 from django.contrib import admin
-from .models import Note
+from .models import Note, NoteBody
 
 # Register your models here.
 
 
+class NoteBodyInline(admin.StackedInline):
+    """
+    Inline editor for a note's content.
+    """
+    model = NoteBody
+    can_delete = False
+    # Every note needs a body, so the content form may not be left blank.
+    extra = 0
+    min_num = 1
+    validate_min = True
+
+
 @admin.register(Note)
 class NoteAdmin(admin.ModelAdmin):
     """
@@ -11,13 +23,14 @@ class NoteAdmin(admin.ModelAdmin):
     """
     list_display = ('title', 'created_at', 'updated_at')
     list_filter = ('created_at', 'updated_at')
-    search_fields = ('title', 'content')
+    search_fields = ('title', 'body__content')
     readonly_fields = ('created_at', 'updated_at')
     ordering = ('-created_at',)
+    inlines = [NoteBodyInline]
 
     fieldsets = (
         ('Note Information', {
-            'fields': ('title', 'content')
+            'fields': ('title',)
         }),
         ('Timestamps', {
             'fields': ('created_at', 'updated_at'),
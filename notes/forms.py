@@ -1,49 +1,83 @@
 from django import forms
-from .models import Note
+from django.db import transaction
+from .models import Note, NoteBody
 
 
 class NoteForm(forms.ModelForm):
     """
     Form for creating and editing sticky notes.
 
-    Uses Django's ModelForm to automatically generate form fields
-    based on the Note model.
+    Uses Django's ModelForm to automatically generate the title field
+    from the Note model. The content field is declared here and saved
+    to the note's NoteBody.
+
+    Both fields strip surrounding whitespace (CharField's default), so
+    whitespace-only input is rejected as a missing required value.
     """
+    content = forms.CharField(
+        label='Content',
+        help_text='Add your note content here',
+        widget=forms.Textarea(attrs={
+            'class': 'form-control',
+            'placeholder': 'Enter note content',
+            'rows': 6
+        })
+    )
 
     class Meta:
         model = Note
-        fields = ['title', 'content']
+        fields = ['title']
         widgets = {
             'title': forms.TextInput(attrs={
                 'class': 'form-control',
                 'placeholder': 'Enter note title',
                 'maxlength': '200'
-            }),
-            'content': forms.Textarea(attrs={
-                'class': 'form-control',
-                'placeholder': 'Enter note content',
-                'rows': 6
             })
         }
         labels = {
-            'title': 'Title',
-            'content': 'Content'
+            'title': 'Title'
         }
         help_texts = {
-            'title': 'Maximum 200 characters',
-            'content': 'Add your note content here'
+            'title': 'Maximum 200 characters'
         }
 
-    def clean_title(self):
-        """Validate that the title is not empty or just whitespace."""
-        title = self.cleaned_data.get('title')
-        if title and not title.strip():
-            raise forms.ValidationError("Title cannot be empty or just whitespace.")
-        return title.strip() if title else title
-
-    def clean_content(self):
-        """Validate that the content is not empty or just whitespace."""
-        content = self.cleaned_data.get('content')
-        if content and not content.strip():
-            raise forms.ValidationError("Content cannot be empty or just whitespace.")
-        return content.strip() if content else content
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.instance.pk is not None:
+            self.initial.setdefault('content', self.instance.content)
+
+    def save(self, commit=True):
+        """
+        Save the note together with its NoteBody.
+
+        On edit only the changed note columns (plus updated_at) are
+        written, and the body is only written when the content changed.
+        With commit=False the body is left unsaved.
+
+        A create issues one INSERT for the note and one for its body.
+        auto_now_add/auto_now timestamps are filled in Python beforehand
+        and the new pk comes back with the insert, so the returned note is
+        already complete; callers shouldn't refresh_from_db() it or
+        re-fetch it with .only(). test_create_note_with_valid_data pins the
+        create POST at four queries: the two INSERTs plus the SAVEPOINT and
+        RELEASE issued by transaction.atomic() inside the test transaction.
+        """
+        note = super().save(commit=False)
+        if not commit:
+            return note
+
+        content = self.cleaned_data['content']
+        with transaction.atomic():
+            if note._state.adding:
+                note.save()
+                NoteBody.objects.create(note=note, content=content)
+            else:
+                # updated_at is always written, even for content-only edits:
+                # the detail page's fragment cache is keyed on it.
+                note_fields = [name for name in self.changed_data if name != 'content']
+                note.save(update_fields=[*note_fields, 'updated_at'])
+                if 'content' in self.changed_data:
+                    # Saving by primary key updates the existing body, or
+                    # inserts one if the note was somehow left without it.
+                    NoteBody(note=note, content=content).save()
+        return note
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.8 on 2026-10-15 03:51
+
+from itertools import islice
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+BATCH_SIZE = 500
+
+
+def copy_content_to_body(apps, schema_editor):
+    """Create a NoteBody for every existing note from its content column."""
+    Note = apps.get_model('notes', 'Note')
+    NoteBody = apps.get_model('notes', 'NoteBody')
+    # Copy in batches so that only one batch of content is held in memory
+    # and no single INSERT carries the whole table.
+    rows = Note.objects.values_list('pk', 'content').iterator(chunk_size=BATCH_SIZE)
+    while True:
+        batch = [
+            NoteBody(note_id=pk, content=content)
+            for pk, content in islice(rows, BATCH_SIZE)
+        ]
+        if not batch:
+            break
+        NoteBody.objects.bulk_create(batch, batch_size=BATCH_SIZE)
+
+
+def copy_body_to_content(apps, schema_editor):
+    """Restore each note's content column from its NoteBody."""
+    Note = apps.get_model('notes', 'Note')
+    NoteBody = apps.get_model('notes', 'NoteBody')
+    for note_id, content in NoteBody.objects.values_list('note_id', 'content').iterator():
+        Note.objects.filter(pk=note_id).update(content=content)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notes', '0002_note_created_at_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NoteBody',
+            fields=[
+                ('note', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='body', serialize=False, to='notes.note')),
+                ('content', models.TextField(help_text='Enter the note content')),
+            ],
+            options={
+                'verbose_name': 'Note body',
+                'verbose_name_plural': 'Note bodies',
+            },
+        ),
+        migrations.RunPython(copy_content_to_body, copy_body_to_content),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.8 on 2026-10-15 03:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notes', '0003_notebody'),
+    ]
+
+    operations = [
+        # Give the column a default first so that reversing the removal
+        # can re-add it to a populated table; 0003 then restores the data.
+        migrations.AlterField(
+            model_name='note',
+            name='content',
+            field=models.TextField(default='', help_text='Enter the note content'),
+        ),
+        migrations.RemoveField(
+            model_name='note',
+            name='content',
+        ),
+    ]
@@ -1,8 +1,40 @@
+from functools import lru_cache
+from urllib.parse import quote
+
+from django.conf import settings
 from django.db import models
-from django.urls import reverse
+from django.urls import get_resolver, get_script_prefix, get_urlconf
+from django.utils.http import RFC3986_SUBDELIMS, escape_leading_slashes
 
 # Create your models here.
 
+# Placeholder primary key used to reverse a note URL pattern once.
+_PK_PLACEHOLDER = 2147483647
+
+
+@lru_cache(maxsize=None)
+def _note_url_template(name, urlconf):
+    """
+    Reverse a note URL once per URLconf and return it as a format string.
+
+    The URL is reversed under a fixed '/' prefix and returned without it,
+    so that the current script prefix can be applied per call.
+    """
+    url = get_resolver(urlconf)._reverse_with_prefix(name, '/', _PK_PLACEHOLDER)
+    return url[1:].replace(str(_PK_PLACEHOLDER), '{pk}')
+
+
+def _note_url(name, pk):
+    """Return the URL of the named note route for the given primary key."""
+    # Formatting a cached template skips a URL resolver walk per call,
+    # which adds up when a list page links every note. The prefix is
+    # quoted the same way reverse() quotes it.
+    urlconf = get_urlconf() or settings.ROOT_URLCONF
+    prefix = quote(get_script_prefix(), safe=RFC3986_SUBDELIMS + '/~:@')
+    return escape_leading_slashes(
+        prefix + _note_url_template(name, urlconf).format(pk=pk)
+    )
+
 
 class Note(models.Model):
     """
@@ -10,13 +42,14 @@ class Note(models.Model):
 
     Attributes:
         title: The title of the note (max 200 characters)
-        content: The main content of the note (unlimited text)
         created_at: Timestamp when the note was created
         updated_at: Timestamp when the note was last modified
+
+    The note's content lives in the related NoteBody so that queries
+    which only need titles and timestamps stay narrow.
     """
     title = models.CharField(max_length=200, help_text="Enter the note title")
-    content = models.TextField(help_text="Enter the note content")
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
@@ -28,6 +61,47 @@ class Note(models.Model):
         """String representation of the Note object."""
         return self.title
 
+    @property
+    def content(self):
+        """The main content of the note, read from its NoteBody."""
+        try:
+            return self.body.content
+        except NoteBody.DoesNotExist:
+            return ''
+
     def get_absolute_url(self):
         """Returns the URL to access a detail record for this note."""
-        return reverse('note_detail', args=[str(self.id)])
+        return _note_url('note_detail', self.id)
+
+    def get_update_url(self):
+        """Returns the URL to edit this note."""
+        return _note_url('note_update', self.id)
+
+    def get_delete_url(self):
+        """Returns the URL to delete this note."""
+        return _note_url('note_delete', self.id)
+
+
+class NoteBody(models.Model):
+    """
+    Model holding the content of a sticky note.
+
+    Attributes:
+        note: The note this content belongs to (also the primary key)
+        content: The main content of the note (unlimited text)
+    """
+    note = models.OneToOneField(
+        Note,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='body'
+    )
+    content = models.TextField(help_text="Enter the note content")
+
+    class Meta:
+        verbose_name = 'Note body'
+        verbose_name_plural = 'Note bodies'
+
+    def __str__(self):
+        """String representation of the NoteBody object."""
+        return f'Body of note {self.note_id}'
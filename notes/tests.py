@@ -1,15 +1,36 @@
+from django.contrib.auth.models import User
+from django.db import connection
 from django.test import TestCase, Client
-from django.urls import reverse
-from .models import Note
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve, reverse, set_script_prefix
+from .models import Note, NoteBody
 from .forms import NoteForm
 
 
+def create_note(title, content):
+    """Create a note together with its body."""
+    note = Note.objects.create(title=title)
+    NoteBody.objects.create(note=note, content=content)
+    return note
+
+
+def bulk_create_notes(numbers):
+    """Create "Note <n>" notes with "Content <n>" bodies in two queries."""
+    notes = Note.objects.bulk_create([Note(title=f"Note {n}") for n in numbers])
+    NoteBody.objects.bulk_create([
+        NoteBody(note=note, content=f"Content {n}")
+        for n, note in zip(numbers, notes)
+    ])
+    return notes
+
+
 class NoteModelTest(TestCase):
     """Test cases for the Note model."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.note = Note.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class."""
+        cls.note = create_note(
             title="Test Note",
             content="This is test content."
         )
@@ -27,11 +48,11 @@ class NoteModelTest(TestCase):
 
     def test_note_ordering(self):
         """Test notes are ordered by creation date (newest first)."""
-        note1 = Note.objects.create(
+        note1 = create_note(
             title="First Note",
             content="First content"
         )
-        note2 = Note.objects.create(
+        note2 = create_note(
             title="Second Note",
             content="Second content"
         )
@@ -44,6 +65,34 @@ class NoteModelTest(TestCase):
         expected_url = reverse('note_detail', args=[str(self.note.id)])
         self.assertEqual(self.note.get_absolute_url(), expected_url)
 
+    def test_note_update_and_delete_urls(self):
+        """Test the get_update_url and get_delete_url methods."""
+        self.assertEqual(
+            self.note.get_update_url(),
+            reverse('note_update', args=[self.note.id])
+        )
+        self.assertEqual(
+            self.note.get_delete_url(),
+            reverse('note_delete', args=[self.note.id])
+        )
+
+    def test_note_urls_follow_script_prefix(self):
+        """Test cached note URLs pick up the current script prefix."""
+        self.note.get_absolute_url()
+        for prefix, expected in (
+            ('/app/', f'/app/notes/{self.note.id}/'),
+            ('/my app/', f'/my%20app/notes/{self.note.id}/'),
+            ('/café/', f'/caf%C3%A9/notes/{self.note.id}/'),
+        ):
+            with self.subTest(prefix=prefix):
+                set_script_prefix(prefix)
+                try:
+                    url = self.note.get_absolute_url()
+                    self.assertEqual(url, expected)
+                    self.assertEqual(url, reverse('note_detail', args=[self.note.id]))
+                finally:
+                    set_script_prefix('/')
+
 
 class NoteFormTest(TestCase):
     """Test cases for the NoteForm."""
@@ -110,7 +159,8 @@ class ViewNotesUseCaseTest(TestCase):
     def test_view_empty_notes_list(self):
         """Test viewing notes list when no notes exist."""
         url = reverse('note_list')
-        response = self.client.get(url)
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'notes/note_list.html')
         self.assertEqual(response.context['total_notes'], 0)
@@ -118,31 +168,88 @@ class ViewNotesUseCaseTest(TestCase):
 
     def test_view_notes_list_with_multiple_notes(self):
         """Test viewing list with multiple notes."""
-        Note.objects.create(title="Note 1", content="Content 1")
-        Note.objects.create(title="Note 2", content="Content 2")
-        Note.objects.create(title="Note 3", content="Content 3")
+        bulk_create_notes(range(1, 4))
 
         url = reverse('note_list')
-        response = self.client.get(url)
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.context['total_notes'], 3)
         self.assertContains(response, "Note 1")
         self.assertContains(response, "Note 2")
         self.assertContains(response, "Note 3")
 
+    def test_view_notes_list_truncates_long_content(self):
+        """Test long content is cut to a preview ending in an ellipsis."""
+        create_note(title="Long Note", content="internationalization " * 25)
+
+        response = self.client.get(reverse('note_list'))
+        preview = ("internationalization " * 25)[:199] + "\u2026"
+        self.assertContains(response, preview)
+
+    def test_view_notes_list_is_paginated(self):
+        """Test the list shows one page of notes at a time."""
+        bulk_create_notes(range(30))
+
+        url = reverse('note_list')
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['total_notes'], 30)
+        self.assertEqual(len(response.context['notes']), 25)
+        self.assertTrue(response.context['page_obj'].has_next())
+
+        response = self.client.get(url, {'page': 2})
+        self.assertEqual(len(response.context['notes']), 5)
+        self.assertFalse(response.context['page_obj'].has_next())
+
+    def test_view_notes_list_invalid_page_falls_back(self):
+        """Test out-of-range and non-numeric pages show a valid page."""
+        bulk_create_notes(range(30))
+
+        url = reverse('note_list')
+        response = self.client.get(url, {'page': 999})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['page_obj'].number, 2)
+
+        response = self.client.get(url, {'page': 'abc'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['page_obj'].number, 1)
+
     def test_view_note_details(self):
         """Test viewing details of a specific note."""
-        note = Note.objects.create(
+        note = create_note(
             title="Detail Test",
             content="Detailed content here"
         )
         url = reverse('note_detail', args=[note.pk])
-        response = self.client.get(url)
+        # A cache miss loads the note and then its body for the card.
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'notes/note_detail.html')
         self.assertContains(response, "Detail Test")
         self.assertContains(response, "Detailed content here")
 
+        # A cache hit only loads the narrow note row.
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertContains(response, "Detailed content here")
+
+    def test_view_note_details_reflects_edits(self):
+        """Test the cached detail card is refreshed after a note is edited."""
+        note = create_note(title="Before", content="Old content")
+        url = reverse('note_detail', args=[note.pk])
+        self.assertContains(self.client.get(url), "Old content")
+
+        self.client.post(
+            reverse('note_update', args=[note.pk]),
+            {'title': "Before", 'content': "New content"}
+        )
+        response = self.client.get(url)
+        self.assertContains(response, "New content")
+        self.assertNotContains(response, "Old content")
+
     def test_view_nonexistent_note_returns_404(self):
         """Test viewing non-existent note returns 404."""
         url = reverse('note_detail', args=[9999])
@@ -160,22 +267,24 @@ class CreateNoteUseCaseTest(TestCase):
 
     def test_create_note_form_display(self):
         """Test create note form is displayed correctly."""
-        response = self.client.get(self.url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'notes/note_form.html')
         self.assertIsInstance(response.context['form'], NoteForm)
 
     def test_create_note_with_valid_data(self):
         """Test creating a note with valid data."""
-        initial_count = Note.objects.count()
         data = {
             'title': 'New Test Note',
             'content': 'This is new content'
         }
-        response = self.client.post(self.url, data)
-        self.assertEqual(Note.objects.count(), initial_count + 1)
+        with self.assertNumQueries(4):
+            response = self.client.post(self.url, data)
+        self.assertEqual(Note.objects.count(), 1)
 
-        note = Note.objects.latest('created_at')
+        pk = resolve(response.url).kwargs['pk']
+        note = Note.objects.get(pk=pk)
         self.assertEqual(note.title, 'New Test Note')
         self.assertEqual(note.content, 'This is new content')
         self.assertRedirects(
@@ -189,8 +298,9 @@ class CreateNoteUseCaseTest(TestCase):
             'title': '',
             'content': 'Content without title'
         }
-        response = self.client.post(self.url, data)
-        self.assertEqual(Note.objects.count(), 0)
+        with self.assertNumQueries(0):
+            response = self.client.post(self.url, data)
+        self.assertFalse(Note.objects.exists())
         self.assertEqual(response.status_code, 200)
         self.assertFormError(
             response.context['form'],
@@ -205,7 +315,7 @@ class CreateNoteUseCaseTest(TestCase):
             'content': 'Valid content'
         }
         response = self.client.post(self.url, data)
-        self.assertEqual(Note.objects.count(), 0)
+        self.assertFalse(Note.objects.exists())
         self.assertFormError(
             response.context['form'],
             'title',
@@ -216,18 +326,23 @@ class CreateNoteUseCaseTest(TestCase):
 class EditNoteUseCaseTest(TestCase):
     """Test cases for editing notes (Use Case: Edit Note)."""
 
-    def setUp(self):
-        """Set up test client and note."""
-        self.client = Client()
-        self.note = Note.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up the note shared by every test in the class."""
+        cls.note = create_note(
             title="Original Title",
             content="Original Content"
         )
+
+    def setUp(self):
+        """Set up test client."""
+        self.client = Client()
         self.url = reverse('note_update', args=[self.note.pk])
 
     def test_edit_note_form_display(self):
         """Test edit note form displays with current data."""
-        response = self.client.get(self.url)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'notes/note_form.html')
         self.assertContains(response, "Original Title")
@@ -239,7 +354,8 @@ class EditNoteUseCaseTest(TestCase):
             'title': 'Updated Title',
             'content': 'Updated Content'
         }
-        response = self.client.post(self.url, data)
+        with self.assertNumQueries(5):
+            response = self.client.post(self.url, data)
         self.note.refresh_from_db()
         self.assertEqual(self.note.title, 'Updated Title')
         self.assertEqual(self.note.content, 'Updated Content')
@@ -248,6 +364,20 @@ class EditNoteUseCaseTest(TestCase):
             reverse('note_detail', args=[self.note.pk])
         )
 
+    def test_edit_note_updates_only_changed_fields(self):
+        """Test editing only the title leaves the note body untouched."""
+        data = {
+            'title': 'Updated Title',
+            'content': 'Original Content'
+        }
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(self.url, data)
+        updates = [q['sql'] for q in queries if q['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"notes_note"', updates[0])
+        self.assertIn('"title"', updates[0])
+        self.assertIn('"updated_at"', updates[0])
+
     def test_edit_note_with_invalid_data(self):
         """Test editing note with invalid data preserves original."""
         data = {
@@ -269,27 +399,39 @@ class EditNoteUseCaseTest(TestCase):
 class DeleteNoteUseCaseTest(TestCase):
     """Test cases for deleting notes (Use Case: Delete Note)."""
 
-    def setUp(self):
-        """Set up test client and note."""
-        self.client = Client()
-        self.note = Note.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up the note shared by every test in the class."""
+        cls.note = create_note(
             title="Note to Delete",
             content="This will be deleted"
         )
+
+    def setUp(self):
+        """Set up test client."""
+        self.client = Client()
         self.url = reverse('note_delete', args=[self.note.pk])
 
     def test_delete_confirmation_page(self):
         """Test delete confirmation page is displayed."""
-        response = self.client.get(self.url)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'notes/note_confirm_delete.html')
         self.assertContains(response, "Note to Delete")
 
+    def test_delete_confirmation_truncates_long_content(self):
+        """Test long content is cut to a preview ending in an ellipsis."""
+        note = create_note(title="Long Note", content="internationalization " * 25)
+
+        response = self.client.get(reverse('note_delete', args=[note.pk]))
+        preview = ("internationalization " * 25)[:299] + "\u2026"
+        self.assertContains(response, preview)
+
     def test_delete_note_successfully(self):
         """Test deleting a note removes it from database."""
-        initial_count = Note.objects.count()
-        response = self.client.post(self.url)
-        self.assertEqual(Note.objects.count(), initial_count - 1)
+        with self.assertNumQueries(3):
+            response = self.client.post(self.url)
         self.assertFalse(Note.objects.filter(pk=self.note.pk).exists())
         self.assertRedirects(response, reverse('note_list'))
 
@@ -300,6 +442,66 @@ class DeleteNoteUseCaseTest(TestCase):
         self.assertEqual(response.status_code, 404)
 
 
+class MissingNoteBodyTest(TestCase):
+    """Test cases for notes that have no NoteBody."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up a note without a body."""
+        cls.note = Note.objects.create(title="Bodiless Note")
+
+    def test_missing_body_reads_as_empty_content(self):
+        """Test a note without a body has empty content."""
+        self.assertEqual(self.note.content, '')
+
+    def test_detail_and_edit_views_render(self):
+        """Test the detail and edit pages render for a note without a body."""
+        response = self.client.get(reverse('note_detail', args=[self.note.pk]))
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Bodiless Note")
+
+        response = self.client.get(reverse('note_update', args=[self.note.pk]))
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Bodiless Note")
+
+    def test_edit_creates_missing_body(self):
+        """Test editing a note without a body saves its content."""
+        self.client.post(
+            reverse('note_update', args=[self.note.pk]),
+            {'title': 'Bodiless Note', 'content': 'Recovered content'}
+        )
+        self.assertEqual(
+            NoteBody.objects.get(pk=self.note.pk).content,
+            'Recovered content'
+        )
+
+
+class NoteAdminTest(TestCase):
+    """Test cases for the Note admin."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up an admin user."""
+        cls.user = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+
+    def setUp(self):
+        """Log the admin user in."""
+        self.client.force_login(self.user)
+
+    def test_add_note_requires_content(self):
+        """Test the admin rejects a note whose inline content is blank."""
+        response = self.client.post(reverse('admin:notes_note_add'), {
+            'title': 'Admin Note',
+            'body-TOTAL_FORMS': '1',
+            'body-INITIAL_FORMS': '0',
+            'body-MIN_NUM_FORMS': '1',
+            'body-MAX_NUM_FORMS': '1',
+            'body-0-content': '',
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(Note.objects.exists())
+
+
 class URLRoutingTest(TestCase):
     """Test cases for URL routing."""
 
@@ -2,9 +2,9 @@ from django.urls import path
 from . import views
 
 urlpatterns = [
-    path('', views.note_list, name='note_list'),
-    path('<int:pk>/', views.note_detail, name='note_detail'),
-    path('create/', views.note_create, name='note_create'),
-    path('<int:pk>/edit/', views.note_update, name='note_update'),
-    path('<int:pk>/delete/', views.note_delete, name='note_delete'),
+    path('', views.NoteListView.as_view(), name='note_list'),
+    path('<int:pk>/', views.NoteDetailView.as_view(), name='note_detail'),
+    path('create/', views.NoteCreateView.as_view(), name='note_create'),
+    path('<int:pk>/edit/', views.NoteUpdateView.as_view(), name='note_update'),
+    path('<int:pk>/delete/', views.NoteDeleteView.as_view(), name='note_delete'),
 ]
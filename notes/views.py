@@ -1,132 +1,123 @@
-from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib import messages
+from django.contrib.messages.views import SuccessMessageMixin
+from django.db.models import Value
+from django.db.models.functions import Coalesce, Left
+from django.urls import reverse_lazy
+from django.views.generic import (
+    CreateView,
+    DeleteView,
+    DetailView,
+    ListView,
+    UpdateView,
+)
 from .models import Note
 from .forms import NoteForm
 
 # Create your views here.
 
+NOTES_PER_PAGE = 25
 
-def note_list(request):
-    """
-    Display a list of all sticky notes.
-
-    Args:
-        request: HttpRequest object
 
-    Returns:
-        Rendered template with list of all notes
+class NoteListView(ListView):
     """
-    notes = Note.objects.all()
-    context = {
-        'notes': notes,
-        'total_notes': notes.count()
-    }
-    return render(request, 'notes/note_list.html', context)
-
+    Display a paginated list of sticky notes.
 
-def note_detail(request, pk):
+    The page of notes is exposed to the template as ``notes`` along with
+    ``page_obj`` and ``total_notes``.
+    """
+    model = Note
+    context_object_name = 'notes'
+    paginate_by = NOTES_PER_PAGE
+
+    def get_queryset(self):
+        """Return notes with only the columns the list cards display."""
+        # Only the leading slice of each note's content is needed for the
+        # card preview, so avoid pulling full content blobs for every row.
+        # The slice is one character longer than the template's
+        # truncatechars limit so that truncated content gets its ellipsis.
+        return (
+            Note.objects.only('id', 'title', 'created_at', 'updated_at')
+            .annotate(content_preview=Left(Coalesce('body__content', Value('')), 201))
+            .order_by('-created_at')
+        )
+
+    def paginate_queryset(self, queryset, page_size):
+        """
+        Paginate like Paginator.get_page(): out-of-range or non-numeric
+        page numbers fall back to the last or first page instead of 404.
+        """
+        paginator = self.get_paginator(queryset, page_size)
+        page = paginator.get_page(self.request.GET.get(self.page_kwarg))
+        return (paginator, page, page.object_list, page.has_other_pages())
+
+    def get_context_data(self, **kwargs):
+        """Add the total note count, reusing the paginator's COUNT."""
+        context = super().get_context_data(**kwargs)
+        context['total_notes'] = context['paginator'].count
+        return context
+
+
+class NoteDetailView(DetailView):
     """
     Display the details of a specific note.
 
-    Args:
-        request: HttpRequest object
-        pk: Primary key of the note to display
-
-    Returns:
-        Rendered template with note details
+    Only the narrow note row is fetched; the template loads the body
+    lazily, so cached detail cards never read the content.
     """
-    note = get_object_or_404(Note, pk=pk)
-    context = {
-        'note': note
-    }
-    return render(request, 'notes/note_detail.html', context)
+    model = Note
 
 
-def note_create(request):
+class NoteCreateView(SuccessMessageMixin, CreateView):
     """
     Handle creation of a new sticky note.
 
     GET: Display empty form
-    POST: Process form submission and create note
+    POST: Process form submission and redirect to the new note
+    """
+    model = Note
+    form_class = NoteForm
+    success_message = 'Note "%(title)s" created successfully!'
+    extra_context = {'action': 'Create'}
 
-    Args:
-        request: HttpRequest object
 
-    Returns:
-        Rendered form template or redirect to note list
-    """
-    if request.method == 'POST':
-        form = NoteForm(request.POST)
-        if form.is_valid():
-            note = form.save()
-            messages.success(request, f'Note "{note.title}" created successfully!')
-            return redirect('note_detail', pk=note.pk)
-    else:
-        form = NoteForm()
-
-    context = {
-        'form': form,
-        'action': 'Create'
-    }
-    return render(request, 'notes/note_form.html', context)
-
-
-def note_update(request, pk):
+class NoteUpdateView(SuccessMessageMixin, UpdateView):
     """
     Handle updating an existing sticky note.
 
     GET: Display form with current note data
-    POST: Process form submission and update note
+    POST: Process form submission and redirect to the note
+    """
+    queryset = Note.objects.select_related('body')
+    form_class = NoteForm
+    success_message = 'Note "%(title)s" updated successfully!'
+    extra_context = {'action': 'Update'}
 
-    Args:
-        request: HttpRequest object
-        pk: Primary key of the note to update
 
-    Returns:
-        Rendered form template or redirect to note detail
-    """
-    note = get_object_or_404(Note, pk=pk)
-
-    if request.method == 'POST':
-        form = NoteForm(request.POST, instance=note)
-        if form.is_valid():
-            note = form.save()
-            messages.success(request, f'Note "{note.title}" updated successfully!')
-            return redirect('note_detail', pk=note.pk)
-    else:
-        form = NoteForm(instance=note)
-
-    context = {
-        'form': form,
-        'note': note,
-        'action': 'Update'
-    }
-    return render(request, 'notes/note_form.html', context)
-
-
-def note_delete(request, pk):
+class NoteDeleteView(DeleteView):
     """
     Handle deletion of a sticky note.
 
     GET: Display confirmation page
     POST: Delete the note and redirect to list
-
-    Args:
-        request: HttpRequest object
-        pk: Primary key of the note to delete
-
-    Returns:
-        Rendered confirmation template or redirect to note list
     """
-    note = get_object_or_404(Note, pk=pk)
-
-    if request.method == 'POST':
-        note_title = note.title
-        note.delete()
-        messages.success(request, f'Note "{note_title}" deleted successfully!')
-        return redirect('note_list')
-
-    context = {
-        'note': note
-    }
-    return render(request, 'notes/note_confirm_delete.html', context)
+    model = Note
+    success_url = reverse_lazy('note_list')
+
+    def get_queryset(self):
+        """Fetch only what the confirmation page or the delete needs."""
+        if self.request.method == 'POST':
+            # Deleting only needs the primary key and the title for the
+            # flash message.
+            return Note.objects.only('id', 'title')
+        # As in the list, slice one character past the truncatechars limit.
+        return (
+            Note.objects.only('id', 'title', 'created_at')
+            .annotate(content_preview=Left(Coalesce('body__content', Value('')), 301))
+        )
+
+    def form_valid(self, form):
+        """Delete the note and flash a confirmation with its title."""
+        note_title = self.object.title
+        response = super().form_valid(form)
+        messages.success(self.request, f'Note "{note_title}" deleted successfully!')
+        return response